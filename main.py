@@ -10,19 +10,24 @@ from rich.table import Table
 from rich import print as rprint
 
 from models import User, Project, Task
-from utils import load_data, save_data, parse_date, validate_email
+from utils import load_data, save_data, parse_date, validate_email, IdAllocator
+from utils.storage import ID_COUNTER_FILE
 
 console = Console()
 
 
 # Command Handlers
 
+def new_allocator(data):
+    """Allocator for a single CLI create, so ids always come from the counter store."""
+    return IdAllocator(ID_COUNTER_FILE, block_size=1, data=data)
+
 def add_user(args):
     """Handle add-user command."""
     data = load_data()
     try:
         validate_email(args.email)
-        user = User.create(args.name, args.email, data)
+        user = User.create(args.name, args.email, data, new_allocator(data))
         save_data(data)
         console.print(f"[green]User '{user.name}' added with ID {user.id}.[/green]")
     except ValueError as e:
@@ -34,7 +39,8 @@ def add_project(args):
     data = load_data()
     try:
         due_date = parse_date(args.due_date)
-        project = Project.create(args.title, args.description, due_date, args.user, data)
+        project = Project.create(args.title, args.description, due_date, args.user, data,
+                                 new_allocator(data))
         save_data(data)
         console.print(f"[green]Project '{project.title}' added with ID {project.id} for user '{args.user}'.[/green]")
     except ValueError as e:
@@ -45,7 +51,7 @@ def add_task(args):
     """Handle add-task command."""
     data = load_data()
     try:
-        task = Task.create(args.project, args.title, args.assigned_to, data)
+        task = Task.create(args.project, args.title, args.assigned_to, data, new_allocator(data))
         save_data(data)
         msg = f"Task '{task.title}' added to project '{args.project}' with ID {task.id}."
         if args.assigned_to:
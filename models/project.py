@@ -1,4 +1,5 @@
 from typing import List, Dict, Any, Optional
+from utils.ids import IdAllocator, allocate_id
 from .user import User
 
 class Project:
@@ -40,16 +41,16 @@ class Project:
 
     @classmethod
     def create(cls, title: str, description: str, due_date: str,
-               owner_name: str, data: Dict) -> "Project":
-        """Create a new project. owner_name must exist. Returns created project."""
+               owner_name: str, data: Dict, allocator: Optional[IdAllocator] = None) -> "Project":
+        """Create a new project. owner_name must exist. Returns created project.
+        If an IdAllocator is given, the id comes from its reserved block."""
         owner = User.find_by_name(owner_name, data)
         if not owner:
             raise ValueError(f"User '{owner_name}' not found")
         projects = data.setdefault(cls.data_key, [])
-        proj_id = data.get(cls.id_counter_key, 1)
+        proj_id = allocate_id(data, cls.id_counter_key, allocator)
         project = cls(proj_id, title, description, due_date, owner.id)
         projects.append(project.to_dict())
-        data[cls.id_counter_key] = proj_id + 1
 
         # Update owner's project_ids
         owner.project_ids.append(proj_id)
@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional
+from utils.ids import IdAllocator, allocate_id
 from .project import Project
 from .user import User
 
@@ -35,8 +36,9 @@ class Task:
 
     @classmethod
     def create(cls, project_title: str, title: str, assigned_to_name: Optional[str],
-               data: Dict) -> "Task":
-        """Create a new task. project_title must exist; assigned_to_name optional."""
+               data: Dict, allocator: Optional[IdAllocator] = None) -> "Task":
+        """Create a new task. project_title must exist; assigned_to_name optional.
+        If an IdAllocator is given, the id comes from its reserved block."""
         project = Project.find_by_title(project_title, data)
         if not project:
             raise ValueError(f"Project '{project_title}' not found")
@@ -46,10 +48,9 @@ class Task:
             if not assigned_user:
                 raise ValueError(f"User '{assigned_to_name}' not found")
         tasks = data.setdefault(cls.data_key, [])
-        task_id = data.get(cls.id_counter_key, 1)
+        task_id = allocate_id(data, cls.id_counter_key, allocator)
         task = cls(task_id, title, assigned_to=assigned_user.id if assigned_user else None)
         tasks.append(task.to_dict())
-        data[cls.id_counter_key] = task_id + 1
 
         # Update project's task_ids
         project.task_ids.append(task_id)
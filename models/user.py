@@ -1,5 +1,6 @@
 import json
 from typing import List, Dict, Any, Optional
+from utils.ids import IdAllocator, allocate_id
 
 class User:
     """Represents a user in the system."""
@@ -32,13 +33,13 @@ class User:
         )
 
     @classmethod
-    def create(cls, name: str, email: str, data: Dict) -> "User":
-        """Create a new user, add to data dictionary, and return the user."""
+    def create(cls, name: str, email: str, data: Dict, allocator: Optional[IdAllocator] = None) -> "User":
+        """Create a new user, add to data dictionary, and return the user.
+        If an IdAllocator is given, the id comes from its reserved block."""
         users = data.setdefault(cls.data_key, [])
-        user_id = data.get(cls.id_counter_key, 1)
+        user_id = allocate_id(data, cls.id_counter_key, allocator)
         user = cls(user_id, name, email)
         users.append(user.to_dict())
-        data[cls.id_counter_key] = user_id + 1
         return user
 
     @classmethod
@@ -17,6 +17,12 @@ def mock_data():
         "next_task_id": 1
     }
 
+@pytest.fixture(autouse=True)
+def id_counter_file(tmp_path):
+    """Keep the CLI's id counter store out of the real data directory."""
+    with patch("main.ID_COUNTER_FILE", str(tmp_path / "id_counters.json")):
+        yield
+
 @patch("main.save_data")
 @patch("main.load_data")
 def test_add_user(mock_load, mock_save, mock_data):
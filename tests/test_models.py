@@ -3,6 +3,8 @@ import json
 from models.user import User
 from models.project import Project
 from models.task import Task
+from utils import ids
+from utils.ids import IdAllocator
 
 @pytest.fixture
 def sample_data():
@@ -70,4 +72,83 @@ def test_complete_task(sample_data):
     assert task.status == "completed"
     # Verify in data
     task_from_data = Task.find_by_id(1, sample_data)
-    assert task_from_data.status == "completed"
\ No newline at end of file
+    assert task_from_data.status == "completed"
+
+
+def test_create_with_allocator(sample_data, tmp_path):
+    allocator = IdAllocator(str(tmp_path / "ids.json"), block_size=10, data=sample_data)
+    User.create("Alex", "a@b.com", sample_data, allocator)
+    Project.create("P1", "desc", "2025-06-01", "Alex", sample_data, allocator)
+    task = Task.create("P1", "Do something", "Alex", sample_data, allocator)
+    assert task.id == 1
+    assert Project.find_by_id(1, sample_data).task_ids == [1]
+    assert sample_data["next_task_id"] == 2
+    # Syncing moves the dataset's counter past the rest of the reserved block
+    allocator.sync_counters(sample_data)
+    assert sample_data["next_task_id"] == 11
+    with open(tmp_path / "ids.json") as f:
+        assert json.load(f)["next_task_id"] == 11
+
+def test_allocators_reserve_disjoint_blocks(sample_data, tmp_path):
+    path = str(tmp_path / "ids.json")
+    other_data = json.loads(json.dumps(sample_data))
+    first = IdAllocator(path, block_size=5, data=sample_data)
+    second = IdAllocator(path, block_size=5, data=other_data)
+    a = User.create("Alex", "a@b.com", sample_data, first)
+    b = User.create("Bob", "b@b.com", other_data, second)
+    c = User.create("Cara", "c@b.com", sample_data, first)
+    assert (a.id, b.id, c.id) == (1, 6, 2)
+
+def test_allocator_seeds_from_existing_counter(sample_data, tmp_path):
+    sample_data["next_user_id"] = 42
+    allocator = IdAllocator(str(tmp_path / "ids.json"), block_size=5, data=sample_data)
+    user = User.create("Alex", "a@b.com", sample_data, allocator)
+    assert user.id == 42
+
+def assert_links_intact(data):
+    """All ids are unique and every *_ids link points to exactly one record."""
+    for key in ("users", "projects", "tasks"):
+        record_ids = [r["id"] for r in data[key]]
+        assert len(record_ids) == len(set(record_ids))
+    project_ids = [pid for u in data["users"] for pid in u["project_ids"]]
+    assert sorted(project_ids) == sorted(p["id"] for p in data["projects"])
+    task_ids = [tid for p in data["projects"] for tid in p["task_ids"]]
+    assert sorted(task_ids) == sorted(t["id"] for t in data["tasks"])
+
+def mixed_creates(data, allocator, sync):
+    """Interleave allocator and plain creates on one dataset."""
+    for n in range(3):
+        User.create(f"A{n}", "a@b.com", data, allocator)
+        if sync:
+            allocator.sync_counters(data)
+        User.create(f"P{n}", "p@b.com", data)
+        Project.create(f"AP{n}", "desc", "2025-06-01", f"A{n}", data, allocator)
+        Project.create(f"PP{n}", "desc", "2025-06-01", f"P{n}", data)
+        Task.create(f"AP{n}", "t", None, data, allocator)
+        Task.create(f"PP{n}", "t", None, data)
+        Task.create(f"PP{n}", "t", None, data, allocator)
+
+def test_mixed_creates_without_sync(sample_data, tmp_path):
+    allocator = IdAllocator(str(tmp_path / "ids.json"), block_size=5, data=sample_data)
+    mixed_creates(sample_data, allocator, sync=False)
+    assert_links_intact(sample_data)
+
+def test_mixed_creates_with_sync(sample_data, tmp_path):
+    allocator = IdAllocator(str(tmp_path / "ids.json"), block_size=5, data=sample_data)
+    mixed_creates(sample_data, allocator, sync=True)
+    assert_links_intact(sample_data)
+    users = [u["id"] for u in sample_data["users"]]
+    assert users == [1, 6, 7, 12, 13, 18]
+
+def test_corrupted_counter_store(sample_data, tmp_path):
+    path = tmp_path / "ids.json"
+    path.write_text("{\"next_user_id\": ")
+    allocator = IdAllocator(str(path), data=sample_data)
+    with pytest.raises(ValueError, match="Corrupted id counter store"):
+        User.create("Alex", "a@b.com", sample_data, allocator)
+
+def test_allocator_requires_file_lock(tmp_path, monkeypatch):
+    monkeypatch.setattr(ids, "fcntl", None)
+    monkeypatch.setattr(ids, "msvcrt", None)
+    with pytest.raises(RuntimeError):
+        ids.IdAllocator(str(tmp_path / "ids.json"))
@@ -1,4 +1,5 @@
 from .storage import load_data, save_data
 from .helpers import parse_date, validate_email
+from .ids import IdAllocator, allocate_id
 
-__all__ = ["load_data", "save_data", "parse_date", "validate_email"]
+__all__ = ["load_data", "save_data", "parse_date", "validate_email", "IdAllocator", "allocate_id"]
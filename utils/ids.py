@@ -0,0 +1,123 @@
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+from .storage import ID_COUNTER_FILE
+
+DEFAULT_BLOCK_SIZE = 50
+
+
+class IdAllocator:
+    """Hands out ids from blocks reserved in a separate, locked counter store.
+    Unused ids in a block are skipped, so ids are unique but may have gaps."""
+
+    def __init__(self, path: str = ID_COUNTER_FILE, block_size: int = DEFAULT_BLOCK_SIZE,
+                 data: Optional[Dict] = None):
+        if block_size < 1:
+            raise ValueError(f"Invalid block size: {block_size}")
+        if not fcntl and not msvcrt:
+            raise RuntimeError("No file locking available for the id counter store")
+        self.path = path
+        self.block_size = block_size
+        self._seed = {k: v for k, v in (data or {}).items() if isinstance(v, int)}
+        self._blocks = {}  # counter key -> [next id, end (exclusive)]
+        self._lock = threading.Lock()
+
+    def next_id(self, key: str, floor: int = 1) -> int:
+        """
+        Return the next id for a counter key (e.g. "next_user_id").
+        Ids below floor are skipped, so pass the dataset's own counter.
+        """
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is None or max(block[0], floor) >= block[1]:
+                block = self._reserve_block(key, floor)
+                self._blocks[key] = block
+            block[0] = max(block[0], floor)
+            new_id = block[0]
+            block[0] += 1
+            return new_id
+
+    def sync_counters(self, data: Dict) -> None:
+        """Raise the dataset's next_*_id past every reserved block. Call before saving."""
+        with self._lock:
+            for key, (_, end) in self._blocks.items():
+                data[key] = max(data.get(key, 1), end)
+
+    def _reserve_block(self, key: str, floor: int) -> list:
+        """Bump the stored counter by one block and return [start, end]."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path + '.lock', 'a+') as lock:
+            _lock_file(lock)
+            try:
+                counters = self._read_counters()
+                start = max(counters.get(key, 1), self._seed.get(key, 1), floor)
+                end = start + self.block_size
+                counters[key] = end
+                self._write_counters(counters)
+            finally:
+                _unlock_file(lock)
+        return [start, end]
+
+    def _read_counters(self) -> Dict[str, int]:
+        """Load the counter store. Raises ValueError if it is corrupted."""
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, 'r') as f:
+            try:
+                return json.load(f)
+            except json.JSONDecodeError:
+                raise ValueError(f"Corrupted id counter store: '{self.path}'")
+
+    def _write_counters(self, counters: Dict[str, int]) -> None:
+        """Write the counter store atomically so a crash never leaves it half-written."""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(counters, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+def allocate_id(data: Dict, key: str, allocator: Optional[IdAllocator] = None) -> int:
+    """Return a new id for a counter key and bump next_*_id in data past it."""
+    if allocator:
+        new_id = allocator.next_id(key, data.get(key, 1))
+    else:
+        new_id = data.get(key, 1)
+    data[key] = max(data.get(key, 1), new_id + 1)
+    return new_id
+
+
+def _lock_file(f) -> None:
+    """Take an exclusive lock on an open file, blocking until it is free."""
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        return
+    while True:
+        # LK_LOCK gives up with OSError after ~10 seconds; keep waiting
+        try:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            continue
+
+
+def _unlock_file(f) -> None:
+    """Release a lock taken by _lock_file."""
+    if fcntl:
+        fcntl.flock(f, fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
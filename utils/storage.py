@@ -3,6 +3,9 @@ import os
 
 # Path to data file (relative to project root)
 DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'project_tracker.json')
+# Id counter store for IdAllocator. It is not reset with DATA_FILE; a stale store
+# only leaves gaps in ids, since allocators never go below the dataset's counters
+ID_COUNTER_FILE = os.path.join(os.path.dirname(DATA_FILE), 'id_counters.json')
 
 def load_data():
     """Load data from JSON file. Returns empty dict if file doesn't exist."""